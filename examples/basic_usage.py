@@ -2,6 +2,10 @@
 Basic usage examples for mpl-richtext showcasing various features.
 """
 
+import mpl_richtext
+
+mpl_richtext.configure(backend='Agg')
+
 import matplotlib.pyplot as plt
 from mpl_richtext import richtext
 
@@ -22,7 +26,7 @@ def create_example():
              ha='center', va='center', ax=ax1)
              
     richtext(0.5, 0.3,
-             strings=list("RAINBOW"),
+             strings=tuple("RAINBOW"),  # tuples are hashable, so caches can key on them
              colors=["red", "orange", "gold", "green", "blue", "indigo", "violet"],
              fontsize=18, fontweight='bold',
              ha='center', va='center', ax=ax1)
@@ -93,9 +97,10 @@ def create_example():
     ax6.axis('off')
     ax6.set_title('6. Alignment', loc='left', fontsize=14, fontweight='bold', pad=10)
     
-    richtext(0.5, 0.8, ["Left Aligned"], ["black"], ha='left', fontsize=14, ax=ax6)
-    richtext(0.5, 0.5, ["Center Aligned"], ["#E67E22"], ha='center', fontsize=14, ax=ax6)
-    richtext(0.5, 0.2, ["Right Aligned"], ["#2980B9"], ha='right', fontsize=14, ax=ax6)
+    rt = mpl_richtext.on(ax6, fontsize=14)
+    rt(0.5, 0.8, ["Left Aligned"], ["black"], ha='left')
+    rt(0.5, 0.5, ["Center Aligned"], ["#E67E22"], ha='center')
+    rt(0.5, 0.2, ["Right Aligned"], ["#2980B9"], ha='right')
     ax6.axvline(0.5, color='#BDC3C7', linestyle='--', zorder=0)
 
     # 7. Targeted Overrides (Dictionary)
@@ -132,8 +137,10 @@ def create_example():
              fontsize=24, fontweight='bold',
              ha='center', va='center', ax=ax9)
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.savefig('examples/mpl_richtext_examples.png', dpi=200, bbox_inches='tight')
+    # bbox_inches='tight' re-runs the layout measurement anyway, so a prior
+    # tight_layout() pass would just draw every text artist twice.
+    plt.savefig('examples/mpl_richtext_examples.png', dpi=200,
+                bbox_inches='tight', pad_inches=0.1)
     print("Example image saved.")
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+"""
+Comprehensive real-world example for mpl-richtext.
+
+Covers syntax highlighting, annotated plots, styled titles, and word wrapping.
+"""
+
+import numpy as np
+
+import mpl_richtext
+
+mpl_richtext.configure(backend='Agg')
+
+import matplotlib.pyplot as plt
+from mpl_richtext import richtext, richtext_batch
+
+
+def create_comprehensive_example():
+    fig = plt.figure(figsize=(14, 10), facecolor='white')
+    fig.suptitle('mpl-richtext in Practice', fontsize=22, fontweight='bold', y=0.97)
+
+    # 1. Syntax Highlighting (code listing)
+    ax1 = fig.add_subplot(2, 2, 1)
+    ax1.axis('off')
+    ax1.set_title('1. Code Listing', loc='left', fontsize=14, fontweight='bold', pad=10)
+
+    code_lines = [
+        (["def ", "fibonacci", "(", "n", "):"],
+         ["#C678DD", "#61AFEF", "#ABB2BF", "#E06C75", "#ABB2BF"]),
+        (["    if ", "n", " <= ", "1", ":"],
+         ["#C678DD", "#E06C75", "#ABB2BF", "#D19A66", "#ABB2BF"]),
+        (["        return ", "n"],
+         ["#C678DD", "#E06C75"]),
+        (["    return ", "fibonacci", "(n-1) + ", "fibonacci", "(n-2)"],
+         ["#C678DD", "#61AFEF", "#ABB2BF", "#61AFEF", "#ABB2BF"]),
+    ]
+
+    # Accumulate all lines and draw them with a single batched call so the
+    # renderer is resolved once for the whole listing, not once per line.
+    ys = 0.8 - 0.2 * np.arange(len(code_lines))
+    segments = [dict(x=0.05, y=y, strings=strings, colors=colors)
+                for y, (strings, colors) in zip(ys, code_lines)]
+    richtext_batch(segments, ax=ax1, fontfamily='monospace', fontsize=13)
+
+    # 2. Annotated Plot (peak / trough labels)
+    ax2 = fig.add_subplot(2, 2, 2)
+    ax2.set_title('2. Annotated Plot', loc='left', fontsize=14, fontweight='bold', pad=10)
+
+    x = np.linspace(0, 4 * np.pi, 100)
+    y = np.sin(x)
+    ax2.plot(x, y, color='#7F8C8D', linewidth=1.5)
+
+    mpl_richtext.annotate_extrema(ax2, x, y, fontsize=11)
+    ax2.set_ylim(-1.6, 1.6)
+
+    # 3. Styled Title & Subtitle
+    ax3 = fig.add_subplot(2, 2, 3)
+    ax3.axis('off')
+    ax3.set_title('3. Styled Titles', loc='left', fontsize=14, fontweight='bold', pad=10)
+
+    richtext(0.5, 0.6,
+             ["Quarterly Report", " (Q3 2025)"],
+             {0: {'size': 18, 'weight': 'bold', 'color': '#2C4A6E'},
+              1: {'size': 12, 'weight': 'normal', 'color': '#556B2F'}},
+             ha='center', va='center', ax=ax3)
+
+    richtext(0.5, 0.35,
+             ["Revenue ", "+12%", " vs last quarter"],
+             colors=["#2C3E50", "#27AE60", "#7F8C8D"],
+             fontweights={1: 'bold'},
+             fontsize=13, ha='center', va='center', ax=ax3)
+
+    # 4. Word Wrapping
+    ax4 = fig.add_subplot(2, 2, 4)
+    ax4.set_title('4. Word Wrapping', loc='left', fontsize=14, fontweight='bold', pad=10)
+    ax4.set_xlim(0, 10)
+    ax4.set_ylim(0, 10)
+
+    richtext(1.0, 8.0,
+             strings=["This is a long paragraph that wraps automatically. ",
+                      "Important parts ",
+                      "can be highlighted ",
+                      "while the rest of the text keeps its default styling, ",
+                      "all inside a fixed-width box."],
+             colors=["#2C3E50", "#E74C3C", "#2980B9", "#2C3E50", "#7F8C8D"],
+             fontweights={1: 'bold', 2: 'bold'},
+             box_width=8.0, fontsize=11, va='top', ax=ax4)
+
+    # bbox_inches='tight' subsumes tight_layout for pure-text figures.
+    plt.savefig('examples/mpl_richtext_real_example.png', dpi=150,
+                bbox_inches='tight', pad_inches=0.1)
+    print("Real example image saved.")
+
+
+if __name__ == "__main__":
+    create_comprehensive_example()
@@ -0,0 +1,30 @@
+"""
+Render all example figures in parallel, one process per figure.
+
+Each figure is independent, so savefig rasterization runs in separate
+processes and is not serialized behind the GIL.
+"""
+
+import os
+
+os.environ.setdefault('MPL_RICHTEXT_BACKEND', 'Agg')
+
+from concurrent.futures import ProcessPoolExecutor
+
+from basic_usage import create_example
+from real_example import create_comprehensive_example
+
+RENDERERS = [create_example, create_comprehensive_example]
+
+
+def _call(fn):
+    fn()
+
+
+def main():
+    with ProcessPoolExecutor(max_workers=len(RENDERERS)) as executor:
+        list(executor.map(_call, RENDERERS))
+
+
+if __name__ == "__main__":
+    main()
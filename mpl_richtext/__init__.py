@@ -2,10 +2,108 @@
 mpl-richtext: Rich text rendering for Matplotlib
 """
 
-from .core import richtext
+import os
+
+# Point Matplotlib's config/cache at a prebuilt directory before matplotlib
+# is imported, so fresh environments (CI, containers) can reuse a warm font
+# cache instead of regenerating it on first import.
+_cache_dir = os.environ.get('MPL_RICHTEXT_CACHE_DIR')
+if _cache_dir and 'MPLCONFIGDIR' not in os.environ:
+    os.environ['MPLCONFIGDIR'] = _cache_dir
+
+import matplotlib
+
+# Honor an explicit backend choice before pyplot is pulled in by core.
+# Headless/CI jobs can set MPL_RICHTEXT_BACKEND=Agg to skip GUI toolkit init.
+_backend = os.environ.get('MPL_RICHTEXT_BACKEND')
+if _backend:
+    matplotlib.use(_backend, force=True)
+
+
+# Default DPI used by save(); rasterization cost scales with pixel count,
+# so batch jobs can trade resolution for speed here.
+_default_dpi = 150
+
+
+def configure(backend=None, default_dpi=None, cache_dir=None):
+    """
+    Configure mpl-richtext for batch/savefig workflows.
+
+    Parameters
+    ----------
+    backend : str, optional
+        Matplotlib backend to switch to (e.g. 'Agg' for headless rendering).
+        Can also be set via the MPL_RICHTEXT_BACKEND environment variable
+        before importing mpl_richtext.
+    default_dpi : int, optional
+        DPI used by `save` when none is given explicitly (default: 150).
+    cache_dir : str, optional
+        Directory holding a prebuilt Matplotlib config/font cache. Matplotlib
+        reads MPLCONFIGDIR at import time, so for the current process this
+        must be set via the MPL_RICHTEXT_CACHE_DIR environment variable
+        before importing mpl_richtext; setting it here still covers worker
+        processes spawned later (e.g. by examples/render_all.py).
+    """
+    global _default_dpi
+    if backend is not None:
+        matplotlib.use(backend, force=True)
+    if default_dpi is not None:
+        _default_dpi = default_dpi
+    if cache_dir is not None:
+        os.environ['MPLCONFIGDIR'] = str(cache_dir)
+
+
+def save(fig, path, **kwargs):
+    """
+    Save a figure at the configured default DPI.
+
+    Any savefig keyword (including an explicit dpi) can be passed through.
+    """
+    kwargs.setdefault('dpi', _default_dpi)
+    fig.savefig(path, **kwargs)
+
+
+def on(ax, **defaults):
+    """
+    Bind `richtext` to an axes with shared defaults.
+
+    The axes transform (``ax.transAxes`` unless overridden via a
+    ``transform`` default) is captured once, so scripts issuing many calls
+    on the same axes skip repeated transform and keyword resolution::
+
+        rt = mpl_richtext.on(ax, fontsize=18)
+        rt(0.5, 0.5, ["hello", ", ", "world"], ["red", "blue", "green"])
+    """
+    transform = defaults.pop('transform', ax.transAxes)
+
+    def bound(x, y, strings, colors=None, **kwargs):
+        return richtext(x, y, strings, colors, ax=ax, transform=transform,
+                        **{**defaults, **kwargs})
+
+    return bound
+
+
+from .core import richtext, richtext_batch
+from .annotate import annotate_extrema
+from ._fontcache import clear_font_cache
 from .version import __version__
 
-__all__ = ['richtext', '__version__']
+__all__ = ['richtext', 'richtext_batch', 'on', 'annotate_extrema',
+           'configure', 'save', 'clear_font_cache',
+           'format_nepali_number', 'format_nepali_number_array',
+           'format_nepali_numbers', 'convert_to_nepali', 'NepaliFormatter',
+           '__version__']
+
+
+def __getattr__(name):
+    # Lazily load the Nepali helpers so `import mpl_richtext` stays cheap
+    # for callers that only need richtext (PEP 562).
+    if name in ('format_nepali_number', 'format_nepali_number_array',
+                'format_nepali_numbers', 'convert_to_nepali',
+                'NepaliFormatter'):
+        from . import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __author__ = 'Rabin Katel'
 __email__ = 'kattelrabinraja13@gmail.com'
@@ -0,0 +1,24 @@
+"""
+Shared FontProperties cache to avoid re-validating identical font signatures
+on every richtext call.
+"""
+
+from functools import lru_cache
+
+from matplotlib.font_manager import FontProperties
+
+
+@lru_cache(maxsize=256)
+def get_font_properties(family=None, size=None, weight=None, style=None):
+    """
+    Return a shared FontProperties for the given signature.
+
+    The returned object is cached and must not be mutated; callers that need
+    an independent copy should call `.copy()` on the result.
+    """
+    return FontProperties(family=family, size=size, weight=weight, style=style)
+
+
+def clear_font_cache():
+    """Drop all cached FontProperties objects."""
+    get_font_properties.cache_clear()
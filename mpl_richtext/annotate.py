@@ -0,0 +1,46 @@
+"""
+Annotation helpers built on top of richtext.
+"""
+
+import numpy as np
+
+from .core import richtext_batch
+
+
+def annotate_extrema(ax, x, y, fmt="{:.2f}", dy=0.2, **kwargs):
+    """
+    Label the maximum and minimum of a trace with one batched richtext call.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes holding the trace.
+    x, y : array-like
+        The trace data. Both extrema are located up front and drawn in a
+        single batch, so the renderer is resolved once for both labels.
+    fmt : str, optional
+        Format spec applied to the extreme values.
+    dy : float, optional
+        Vertical offset in data units between each extremum and its label.
+    **kwargs : dict
+        Shared richtext arguments (e.g. fontsize) applied to both labels.
+
+    Returns
+    -------
+    List[List[matplotlib.text.Text]]
+        The Text objects for the max and min labels, in that order.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    i_max = int(np.argmax(y))
+    i_min = int(np.argmin(y))
+    return richtext_batch([
+        dict(x=x[i_max], y=y[i_max] + dy,
+             strings=["Max Value: ", fmt.format(y[i_max])],
+             colors=["black", "red"], fontweights=["normal", "bold"],
+             ha='center', va='bottom'),
+        dict(x=x[i_min], y=y[i_min] - dy,
+             strings=["Min Value: ", fmt.format(y[i_min])],
+             colors=["black", "blue"], fontweights=["normal", "bold"],
+             ha='center', va='top'),
+    ], ax=ax, **kwargs)
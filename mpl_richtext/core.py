@@ -1,49 +1,198 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.text import Text
 from matplotlib.lines import Line2D
 from matplotlib.lines import Line2D
 import matplotlib.font_manager as fm
+from matplotlib.colors import to_rgba_array
 from matplotlib.font_manager import FontProperties, findfont
 from typing import List, Optional, Tuple, Union, Dict, Any
 
-from .shaping import ShapedText, HarfbuzzShaper, HAS_HARFBUZZ
+from .shaping import ShapedText, HarfbuzzShaper, get_shaper, HAS_HARFBUZZ
+from ._fontcache import get_font_properties
+
+# Sentinel for "no override at this index" in densified mapping kwargs.
+_MISSING = object()
+
+
+class FrozenProps(dict):
+    """
+    Immutable, hashable property mapping for one text segment.
+
+    Behaves like the plain dicts it replaces (``**props`` call sites,
+    ``.items()`` iteration and ``.copy()`` keep working unchanged) but
+    blocks mutation and caches its hash, so normalized props can key
+    lru_cache-style caches directly instead of being re-serialized into
+    signature tuples on every lookup.
+    """
+    __slots__ = ('_hash',)
+
+    def __hash__(self):
+        h = getattr(self, '_hash', None)
+        if h is None:
+            h = hash(tuple(sorted((k, repr(v)) for k, v in self.items())))
+            object.__setattr__(self, '_hash', h)
+        return h
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('FrozenProps is immutable; copy() it to modify')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    pop = _immutable
+    popitem = _immutable
+    clear = _immutable
+    update = _immutable
+    setdefault = _immutable
+    del _immutable
+
+# Canonical FrozenProps instances keyed by themselves. Most plots reuse a
+# handful of styles across many segments and calls; interning lets every
+# equal property set share one object (and one cached hash), so downstream
+# cache lookups compare identity-equal keys instead of re-walking items.
+_PROPS_INTERN: Dict['FrozenProps', 'FrozenProps'] = {}
+_PROPS_INTERN_MAX = 1024
+
+
+def _intern_props(props: 'FrozenProps') -> 'FrozenProps':
+    """Return the canonical instance for an equal-valued FrozenProps."""
+    try:
+        canonical = _PROPS_INTERN.get(props)
+        if canonical is None:
+            if len(_PROPS_INTERN) >= _PROPS_INTERN_MAX:
+                _PROPS_INTERN.clear()
+            _PROPS_INTERN[props] = props
+            canonical = props
+        return canonical
+    except (TypeError, ValueError):
+        # Unhashable value, or one that does not compare by value (e.g. a
+        # numpy color array, whose == returns an array and makes the dict's
+        # equality probe ambiguous); use the instance as-is.
+        return props
+
+
+# Color lists already batch-validated, keyed by the tuple of specs.
+# Capped like the other module-level caches so data-driven palettes
+# (a new tuple per call) cannot grow it without bound.
+_VALIDATED_COLORS: set = set()
+_VALIDATED_COLORS_MAX = 1024
+
 
+def _validate_color_list(colors: List[Any]) -> None:
+    """
+    Validate a list of color specs with a single to_rgba_array call.
+
+    Validated tuples are memoized so repeated calls with the same palette
+    skip parsing entirely. The original specs are kept on the artists (so
+    Text.get_color() still reports what the caller passed); lists that
+    to_rgba_array cannot handle (e.g. containing None) fall through to
+    Matplotlib's per-segment handling.
+    """
+    try:
+        key = tuple(colors)
+        hash(key)
+    except TypeError:
+        return
+    if key in _VALIDATED_COLORS:
+        return
+    try:
+        to_rgba_array(list(colors))
+    except (ValueError, TypeError):
+        return
+    if len(_VALIDATED_COLORS) >= _VALIDATED_COLORS_MAX:
+        _VALIDATED_COLORS.clear()
+    _VALIDATED_COLORS.add(key)
+
+
+# Devanagari: U+0900 to U+097F
+# Devanagari Extended: U+A8E0 to U+A8FF
+# Vedic Extensions: U+1CD0 to U+1CFF
+_COMPLEX_RE = re.compile('[\\u0900-\\u097F\\uA8E0-\\uA8FF\\u1CD0-\\u1CFF]')
+
+# One wrap token: a word with its trailing whitespace, or a bare run of
+# whitespace (e.g. a segment boundary that starts with a space).
+_WORD_RE = re.compile(r'\S+\s*|\s+')
+
+
+@lru_cache(maxsize=2048)
 def _needs_complex_shaping(text: str) -> bool:
     """
     Check if text contains characters from complex scripts that need HarfBuzz shaping.
     Currently checks for Devanagari (used for Nepali, Hindi, Sanskrit, etc.)
+
+    The compiled regex scans in C and bails on the first match, and results
+    are memoized since the same words recur across measurement and draw.
     """
-    for char in text:
-        code = ord(char)
-        # Devanagari: U+0900 to U+097F
-        # Devanagari Extended: U+A8E0 to U+A8FF  
-        # Vedic Extensions: U+1CD0 to U+1CFF
-        if (0x0900 <= code <= 0x097F or 
-            0xA8E0 <= code <= 0xA8FF or
-            0x1CD0 <= code <= 0x1CFF):
-            return True
-    return False
+    return _COMPLEX_RE.search(text) is not None
+
+# Resolved font paths keyed by the font signature of the text kwargs.
+_FONT_PATH_CACHE: Dict[Tuple, Optional[str]] = {}
+
 
 def _resolve_font_path(kwargs: Dict[str, Any]) -> Optional[str]:
-    """Helper to resolve font file path from text kwargs."""
+    """Helper to resolve font file path from text kwargs (memoized)."""
     fp = kwargs.get('fontproperties')
     if fp:
-        return findfont(fp)
-        
-    font = kwargs.get('fontfamily') or kwargs.get('family')
-    if not font:
-        # Fallback to default
-        font = plt.rcParams['font.family'][0]
-    
-    if isinstance(font, list):
-        font = font[0]
-        
+        key = ('fp', tuple(fp.get_family()), fp.get_size(),
+               fp.get_weight(), fp.get_style())
+    else:
+        font = kwargs.get('fontfamily') or kwargs.get('family')
+        if not font:
+            # Fallback to default
+            font = plt.rcParams['font.family'][0]
+        if isinstance(font, list):
+            font = font[0]
+        key = ('family', font)
+
+    if key in _FONT_PATH_CACHE:
+        return _FONT_PATH_CACHE[key]
+
     try:
-        fp = FontProperties(family=font)
-        return findfont(fp)
+        if not fp:
+            fp = get_font_properties(family=font)
+        path = findfont(fp)
     except Exception:
-        return None
+        path = None
+    _FONT_PATH_CACHE[key] = path
+    return path
+
+@lru_cache(maxsize=256)
+def _font_vmetrics(path: str, fontsize: float) -> Tuple[float, float]:
+    """
+    Font-level (ascent, line height) in points for one font file and size.
+
+    These are constants of the face once loaded, so they are resolved once
+    per (path, fontsize) instead of being re-queried for every word.
+    """
+    shaper = get_shaper(path)
+    return shaper.get_ascent(fontsize), shaper.get_font_height(fontsize)
+
+
+@lru_cache(maxsize=256)
+def _ft_font_height_points(path: str, fontsize: float) -> float:
+    """
+    Line height in points from FreeType's hhea metrics, no shaper needed.
+
+    Reads ascender/descender off the font-manager-cached FT2Font, so the
+    height of a style costs one table lookup instead of laying out a probe
+    string through a Text artist.
+    """
+    font = fm.get_font(path)
+    return (font.ascender - font.descender) / font.units_per_EM * fontsize
+
+
+def _get_renderer(fig):
+    """Resolve the figure's renderer, forcing a draw only if necessary."""
+    try:
+        return fig.canvas.get_renderer()
+    except Exception:
+        fig.canvas.draw()
+        return fig.canvas.get_renderer()
 
 def richtext(
     x: float,
@@ -86,6 +235,9 @@ def richtext(
         
         Global arguments (applied to the whole block):
         - box_width (float): Maximum width of the text block for wrapping. If None, no wrapping occurs.
+        - wrap_algo (str): Line-breaking strategy when box_width is set:
+          'optimal' (default) minimizes squared leftover space per line,
+          'greedy' uses first-fit.
         - linespacing (float): Line spacing multiplier (default: 1.5).
         - ha (str): Horizontal alignment ('left', 'center', 'right').
         - va (str): Vertical alignment ('top', 'center', 'bottom').
@@ -112,8 +264,13 @@ def richtext(
     if ax is None:
         ax = plt.gca()
 
+    # Coerce to a tuple so the segment list is hashable for the internal
+    # caches (and so generators/any sequence work as input).
+    strings = tuple(strings)
+
     # Extract global special kwargs
     box_width: Optional[float] = kwargs.pop('box_width', None)
+    wrap_algo: str = kwargs.pop('wrap_algo', 'optimal')
     linespacing: float = kwargs.pop('linespacing', 1.5)
     if 'spacing' in kwargs:
         linespacing = kwargs.pop('spacing')
@@ -136,41 +293,119 @@ def richtext(
             # If both were provided, styles takes precedence (already passed as styles param)
     
     
-    # Normalize properties for each string segment
-    segment_properties = _normalize_properties(strings, colors, styles=styles, **kwargs)
+    # Normalize properties for each string segment; underline is carried
+    # separately so the props stay pure ax.text kwargs.
+    segment_properties, underlines = _normalize_properties(
+        strings, colors, styles=styles, **kwargs)
 
     # Get renderer for measuring text
     fig = ax.get_figure()
     if fig == None:
          raise ValueError("The axes must be associated with a figure.")
          
-    try:
-        renderer = fig.canvas.get_renderer()
-    except Exception:
-        fig.canvas.draw()
-        renderer = fig.canvas.get_renderer()
+    renderer = _get_renderer(fig)
+
+    # Capture the loop-invariant state (inverted transform, rcParams
+    # defaults, points_to_pixels) once; measurement and underline placement
+    # reuse it instead of re-deriving it per word.
+    ctx = _measure_ctx(ax, renderer)
 
     # Logic separation: Wrapping vs Non-Wrapping
     if box_width is not None:
         # 1. Tokenize into words with properties
-        words = _tokenize_strings(strings, segment_properties)
+        words = _tokenize_strings(strings, segment_properties, underlines)
         # 2. Build lines with wrapping
-        lines = _build_lines_wrapped(words, ax, renderer, box_width)
+        lines = _build_lines_wrapped(words, ax, renderer, box_width, ctx=ctx,
+                                     wrap_algo=wrap_algo)
     else:
+        # Common case: one line of plain (non-shaped, non-underlined) text.
+        # The final artists double as the measurement artists, so the whole
+        # measure-then-draw pipeline collapses into a single layout pass.
+        if _fast_line_ok(strings, underlines):
+            return _draw_line_fast(strings, segment_properties, x, y, ax,
+                                   renderer, ctx, linespacing=linespacing,
+                                   ha=ha, va=va, transform=transform,
+                                   zorder=zorder)
         # 1. Treat strings as segments
         # 2. Build a single line
-        lines = [_build_line_seamless(strings, segment_properties, ax, renderer)]
+        lines = [_build_line_seamless(strings, segment_properties, underlines,
+                                      ax, renderer, ctx=ctx)]
 
     # 3. Draw lines
     text_objects = _draw_lines(
-        lines, x, y, ax, renderer, 
-        linespacing=linespacing, ha=ha, va=va, 
-        transform=transform, zorder=zorder
+        lines, x, y, ax, renderer,
+        linespacing=linespacing, ha=ha, va=va,
+        transform=transform, zorder=zorder, ctx=ctx
     )
 
     return text_objects
 
 
+def richtext_batch(
+    segments: List[Dict[str, Any]],
+    ax: Optional[Axes] = None,
+    **shared_kwargs
+) -> List[List[Text]]:
+    """
+    Draw several richtext blocks on one axes in a single pass.
+
+    Resolving the renderer (which may force a full canvas draw) happens once
+    for the whole batch instead of once per `richtext` call, which matters for
+    multi-line figures like code listings.
+
+    Parameters
+    ----------
+    segments : List[Dict[str, Any]]
+        One dict per block. Each must contain 'x', 'y' and 'strings', and may
+        contain any other `richtext` argument (e.g. 'colors', 'styles').
+    ax : matplotlib.axes.Axes, optional
+        The axes to draw on. If None, uses the current axes.
+    **shared_kwargs : dict
+        Defaults applied to every segment; per-segment keys take precedence.
+
+    Returns
+    -------
+    List[List[matplotlib.text.Text]]
+        The Text objects created for each segment, in input order.
+    """
+    if ax is None:
+        ax = plt.gca()
+
+    fig = ax.get_figure()
+    if fig is None:
+        raise ValueError("The axes must be associated with a figure.")
+
+    # Force any pending draw once up front so every richtext call below
+    # gets the renderer without triggering its own draw.
+    _get_renderer(fig)
+
+    results: List[List[Text]] = []
+    for segment in segments:
+        seg = dict(segment)
+        x = seg.pop('x')
+        y = seg.pop('y')
+        strings = seg.pop('strings')
+        colors = seg.pop('colors', None)
+        styles = seg.pop('styles', None)
+        merged = {**shared_kwargs, **seg}
+        results.append(richtext(x, y, strings, colors, styles=styles, ax=ax, **merged))
+    return results
+
+
+# Plural kwarg names (e.g. fontsizes) mapped to the singular property they
+# override; 'colors' is a special case when passed through kwargs.
+_PLURAL_MAP = {
+    'fontsizes': 'fontsize',
+    'fontweights': 'fontweight',
+    'fontfamilies': 'fontfamily',
+    'fontstyles': 'fontstyle',
+    'alphas': 'alpha',
+    'backgroundcolors': 'backgroundcolor',
+    'colors': 'color',
+    'underlines': 'underline'
+}
+
+
 def _normalize_properties(
     strings: List[str], 
     colors: Union[str, List[Any], Dict[Any, Any]], 
@@ -178,7 +413,9 @@ def _normalize_properties(
     **kwargs
 ) -> List[Dict[str, Any]]:
     """
-    Normalize colors, styles dict, and kwargs into a list of property dictionaries, one for each string.
+    Normalize colors, styles dict, and kwargs into a list of property
+    mappings plus a parallel per-segment underline list, one entry per
+    string.
     Supports:
     - Scalar values (applied globally).
     - Lists of values (dynamic extension).
@@ -194,7 +431,21 @@ def _normalize_properties(
     """
     n = len(strings)
     props_list = []
-    
+    underlines: List[bool] = []
+
+    # Fast path: a single color (or none), no styles dict, and only scalar
+    # kwargs means every segment carries identical properties. Skip the
+    # mapping/list machinery and share one frozen property set.
+    if (not styles and isinstance(colors, (str, type(None)))
+            and not any(k in _PLURAL_MAP or isinstance(v, (list, dict))
+                        for k, v in kwargs.items())):
+        base = dict(kwargs)
+        if colors is not None:
+            base['color'] = colors
+        underline = bool(base.pop('underline', False))
+        shared = _intern_props(FrozenProps(base))
+        return [shared] * n, [underline] * n
+
     # Property alias mapping for user-friendly names
     PROPERTY_ALIASES = {
         'weight': 'fontweight',
@@ -253,13 +504,18 @@ def _normalize_properties(
     # Handle colors
     color_mapping = parse_mapping(colors)
     color_list = [None] * n
-    
+
     if color_mapping is not None:
-        pass 
+        # Densify the sparse mapping so the per-segment loop below is a
+        # plain list index instead of a dict lookup.
+        for idx, v in color_mapping.items():
+            if isinstance(idx, int) and 0 <= idx < n:
+                color_list[idx] = v
     elif isinstance(colors, str):
         color_list = [colors] * n
     elif isinstance(colors, list):
         color_list = extend_list(colors, n)
+        _validate_color_list(color_list)
     else:
         if colors is not None:
              raise ValueError("colors must be a string, a list, or a mapping.")
@@ -269,23 +525,11 @@ def _normalize_properties(
     mapping_kwargs = {}
     scalar_kwargs = {}
     
-    # Map plural keys to singular keys
-    plural_map = {
-        'fontsizes': 'fontsize',
-        'fontweights': 'fontweight',
-        'fontfamilies': 'fontfamily',
-        'fontstyles': 'fontstyle',
-        'alphas': 'alpha',
-        'backgroundcolors': 'backgroundcolor',
-        'colors': 'color', # Special case if passed in kwargs
-        'underlines': 'underline'
-    }
-    
     # Separate kwargs into types
     for k, v in kwargs.items():
         # Check for plural override first
-        if k in plural_map:
-            singular_k = plural_map[k]
+        if k in _PLURAL_MAP:
+            singular_k = _PLURAL_MAP[k]
             mapping = parse_mapping(v)
             if mapping is not None:
                 if singular_k not in mapping_kwargs:
@@ -303,134 +547,240 @@ def _normalize_properties(
             list_kwargs[k] = extend_list(v, n)
         else:
             scalar_kwargs[k] = v
-            
+
+    # Densify sparse mapping kwargs (e.g. fontsizes={1: 20, 3: 30}) into
+    # per-index lists once, instead of a hash lookup per kwarg per segment.
+    dense_kwargs: Dict[str, List[Any]] = {}
+    for k, v_map in mapping_kwargs.items():
+        dense = [_MISSING] * n
+        for idx, v in v_map.items():
+            if isinstance(idx, int) and 0 <= idx < n:
+                dense[idx] = v
+        dense_kwargs[k] = dense
+
+    # Pre-expand the styles dict (tuple keys -> per-index override dicts,
+    # alias names normalized once) so the per-segment loop below is a list
+    # index instead of a scan over every styles entry.
+    style_overrides: List[Optional[Dict[str, Any]]] = [None] * n
+    if styles:
+        for key, style_dict in styles.items():
+            normalized = {normalize_property_name(prop_name): prop_value
+                          for prop_name, prop_value in style_dict.items()}
+            indices = key if isinstance(key, tuple) else (key,)
+            for idx in indices:
+                if isinstance(idx, int) and 0 <= idx < n:
+                    if style_overrides[idx] is None:
+                        style_overrides[idx] = dict(normalized)
+                    else:
+                        style_overrides[idx].update(normalized)
+
+    # Segments with no per-index overrides all share one frozen property
+    # set built from the scalar kwargs instead of carrying a private copy.
+    shared_base: Optional[FrozenProps] = None
+    base_underline = bool(scalar_kwargs.get('underline', False))
+
     for i in range(n):
-        # 1. Start with scalar (global) properties
-        props = scalar_kwargs.copy()
-        
-        # 2. Apply list-based properties (if any)
+        # Collect per-index overrides in priority order: lists, then color,
+        # then sparse mappings, then the styles dict on top.
+        overrides: Dict[str, Any] = {}
         for k, v_list in list_kwargs.items():
-            props[k] = v_list[i]
-            
-        # 3. Apply color (specific overrides global)
+            overrides[k] = v_list[i]
         if color_list[i] is not None:
-             props['color'] = color_list[i]
-        
-        if color_mapping and i in color_mapping:
-            props['color'] = color_mapping[i]
-        
-        # 4. Apply mapping-based properties (specific overrides global & list)
-        for k, v_map in mapping_kwargs.items():
-            if i in v_map:
-                props[k] = v_map[i]
-        
-        # 5. Apply styles dict if provided (highest priority for specified segments)
-        if styles:
-            # Expand tuple keys in styles dict
-            # e.g., {(0, 2, 4): {...}} applies to indices 0, 2, and 4
-            for key, style_dict in styles.items():
-                indices_to_apply = []
-                if isinstance(key, tuple):
-                    indices_to_apply = list(key)
-                elif isinstance(key, int):
-                    indices_to_apply = [key]
-                
-                if i in indices_to_apply:
-                    # Normalize property names (handle aliases)
-                    for prop_name, prop_value in style_dict.items():
-                        normalized_name = normalize_property_name(prop_name)
-                        props[normalized_name] = prop_value
-                
-        props_list.append(props)
+            overrides['color'] = color_list[i]
+        for k, dense in dense_kwargs.items():
+            v = dense[i]
+            if v is not _MISSING:
+                overrides[k] = v
+        if style_overrides[i]:
+            overrides.update(style_overrides[i])
 
-        
-    return props_list
+        if not overrides:
+            if shared_base is None:
+                base = dict(scalar_kwargs)
+                base.pop('underline', None)
+                shared_base = _intern_props(FrozenProps(base))
+            props_list.append(shared_base)
+            underlines.append(base_underline)
+            continue
+
+        props = {**scalar_kwargs, **overrides}
+        # Underline is not an ax.text property; keep it out of the frozen
+        # props (and out of every downstream copy/pop) as its own column.
+        underlines.append(bool(props.pop('underline', False)))
+        # Freeze once fully assembled; downstream caches key on the hash,
+        # and interning makes equal styles share one canonical object.
+        props_list.append(_intern_props(FrozenProps(props)))
+
+    return props_list, underlines
 
 
 def _tokenize_strings(
-    strings: List[str], 
-    properties: List[Dict[str, Any]]
-) -> List[Tuple[str, Dict[str, Any]]]:
+    strings: List[str],
+    properties: List[Dict[str, Any]],
+    underlines: List[bool]
+) -> List[Tuple[str, Dict[str, Any], bool]]:
     """
     Split strings into words while preserving spaces and associating properties.
     Used ONLY when wrapping is enabled.
+
+    Tokens come straight from the regex as slices of the original string
+    (word plus trailing whitespace, or a run of leading whitespace), so no
+    per-word concatenation is needed.
     """
-    words: List[Tuple[str, Dict[str, Any]]] = []
-    for string, props in zip(strings, properties):
-        parts = string.split(' ')
-        for i, part in enumerate(parts):
-            if i < len(parts) - 1:
-                words.append((part + ' ', props))
-            else:
-                if part:
-                    words.append((part, props))
-                elif not part and i > 0:
-                     pass
+    words: List[Tuple[str, Dict[str, Any], bool]] = []
+    for string, props, underline in zip(strings, properties, underlines):
+        for m in _WORD_RE.finditer(string):
+            words.append((m.group(), props, underline))
     return words
 
 
-def _get_text_width(text: str, ax: Axes, renderer, **text_kwargs) -> float:
+# Per-call measurement context: the inverted data transform, the rcParams
+# defaults, and the renderer's points_to_pixels bound method. All of these
+# are loop-invariant for one richtext call, so they are captured once here
+# instead of being re-fetched (rcParams lookups validate on every access)
+# inside the per-word helpers.
+_MeasureCtx = namedtuple('_MeasureCtx',
+                         ['inv', 'sx', 'sy',
+                          'default_family', 'default_size', 'pts2px'])
+
+
+def _measure_ctx(ax: Axes, renderer) -> _MeasureCtx:
+    """Capture the loop-invariant measurement state for one call."""
+    inv = ax.transData.inverted()
+    # Pixel -> data scale factors off the affine diagonal, so converting a
+    # scalar extent is a multiply instead of a Bbox round-trip.
+    m = inv.get_matrix()
+    return _MeasureCtx(inv=inv, sx=abs(m[0, 0]), sy=abs(m[1, 1]),
+                       default_family=plt.rcParams['font.family'][0],
+                       default_size=plt.rcParams['font.size'],
+                       pts2px=renderer.points_to_pixels)
+
+
+# Measurement results keyed by (kind, text, style, axes, renderer, scale).
+# Keying on the frozen data transform invalidates entries when axes limits
+# or figure size change; keying on the renderer id covers canvas swaps.
+_MEASUREMENT_CACHE: Dict[Tuple, Any] = {}
+_MEASUREMENT_CACHE_MAX = 4096
+
+
+def _measurement_key(kind: str, text: str, ax: Axes, renderer,
+                     kwargs: Dict[str, Any]) -> Tuple:
+    transform_key = ax.transData.frozen().get_matrix().tobytes()
+    return (kind, text, _metric_signature(kwargs),
+            id(ax), id(renderer), transform_key)
+
+
+# Persistent hidden measurement artists: one detached Text per figure and
+# metric signature, reused across calls via set_text instead of being
+# allocated and discarded per word. The pool lives on the figure itself
+# (the artists hold a reference to their figure anyway), so it is freed
+# together with the figure.
+_MEASURE_ARTISTS_ATTR = '_mpl_richtext_measure_artists'
+_MEASURE_ARTISTS_PER_FIG = 64
+
+
+def _measurement_artist(fig, kwargs: Dict[str, Any], sig: Tuple = None) -> Text:
+    """Return the figure's reusable measurement artist for these props.
+
+    Callers that already computed the metric signature (e.g. the grouped
+    measurement pass) can hand it in to skip recomputing it here.
+    """
+    per_fig = getattr(fig, _MEASURE_ARTISTS_ATTR, None)
+    if per_fig is None:
+        per_fig = {}
+        setattr(fig, _MEASURE_ARTISTS_ATTR, per_fig)
+    if sig is None:
+        sig = _metric_signature(kwargs)
+    t = per_fig.get(sig)
+    if t is None:
+        if len(per_fig) >= _MEASURE_ARTISTS_PER_FIG:
+            per_fig.clear()
+        t = Text(0, 0, '', **{k: v for k, v in kwargs.items()
+                              if k not in _NON_METRIC_KEYS})
+        t.set_figure(fig)
+        per_fig[sig] = t
+    return t
+
+
+def _measure_cached(kind: str, fn, text: str, ax: Axes, renderer,
+                    kwargs: Dict[str, Any], ctx=None):
+    """Return fn(text, ...) memoized; repeated words skip the artist dance."""
+    key = _measurement_key(kind, text, ax, renderer, kwargs)
+    result = _MEASUREMENT_CACHE.get(key)
+    if result is None:
+        if len(_MEASUREMENT_CACHE) >= _MEASUREMENT_CACHE_MAX:
+            _MEASUREMENT_CACHE.clear()
+        result = fn(text, ax, renderer, ctx=ctx, **kwargs)
+        _MEASUREMENT_CACHE[key] = result
+    return result
+
+
+def _get_text_width(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> float:
+    """Measure the width of a text string (memoized)."""
+    return _measure_cached('width', _get_text_width_uncached,
+                           text, ax, renderer, text_kwargs, ctx=ctx)
+
+
+def _get_text_width_uncached(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> float:
     """Measure the width of a text string."""
-    # Remove custom properties that ax.text doesn't understand
-    kwargs = text_kwargs.copy()
-    kwargs.pop('underline', None)
+    # Building the context is not free; callers measuring many words pass it
+    # in once rather than re-deriving it per word.
+    if ctx is None:
+        ctx = _measure_ctx(ax, renderer)
+    # Normalization keeps underline out of the props, so the kwargs are pure
+    # ax.text properties and need no copy-and-pop here.
+    kwargs = text_kwargs
     
     # Try shaping if available
     if HAS_HARFBUZZ:
-        font = kwargs.get('fontfamily') or kwargs.get('family') or plt.rcParams['font.family'][0]
+        font = kwargs.get('fontfamily') or kwargs.get('family') or ctx.default_family
         # Resolve font path
         try:
             # Handle fontfamily being None or list
             if not font:
-                 font = plt.rcParams['font.family'][0]
+                 font = ctx.default_family
             if isinstance(font, list):
                 font = font[0]
                 
-            fp = FontProperties(family=font)
+            fp = get_font_properties(family=font)
             path = findfont(fp)
             
             # Simple caching could go here
             if path:
-                fontsize = kwargs.get('fontsize') or kwargs.get('size') or plt.rcParams['font.size']
-                shaper = HarfbuzzShaper(path)
+                fontsize = kwargs.get('fontsize') or kwargs.get('size') or ctx.default_size
+                shaper = get_shaper(path)
                 width_points = shaper.get_text_width(text, fontsize)
                 
-                # Convert points -> pixels -> data
-                # 1. Points to Pixels
-                pixels = renderer.points_to_pixels(width_points)
-                
-                # 2. Pixels to Data
-                # We can measure the width of a 0-width line vs 'pixels'-width line?
-                # Or use proper transform math.
-                # bbox width in pixels = 'pixels'.
-                # We want width in data.
-                
-                # Create a bbox in display coords
-                from matplotlib.transforms import Bbox
-                bbox_display = Bbox.from_bounds(0, 0, pixels, 0)
-                
-                # Transform to data coords
-                bbox_data = bbox_display.transformed(ax.transData.inverted())
-                return bbox_data.width
+                # Convert points -> pixels -> data with the cached scale.
+                pixels = ctx.pts2px(width_points)
+                return pixels * ctx.sx
         except Exception:
             pass # Fallback to native
 
-    t = ax.text(0, 0, text, **kwargs)
+    # The figure's persistent detached artist never touches the Axes child
+    # list and is reused across calls instead of allocated per word.
+    t = _measurement_artist(ax.get_figure(), kwargs)
+    t.set_text(text)
     bbox = t.get_window_extent(renderer=renderer)
-    bbox_data = bbox.transformed(ax.transData.inverted())
-    w = bbox_data.width
-    t.remove()
-    return w
+    return bbox.width * ctx.sx
+
 
+def _get_text_metrics(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> tuple:
+    """Get text metrics (memoized): (width, ascent, height) in data units."""
+    return _measure_cached('metrics', _get_text_metrics_uncached,
+                           text, ax, renderer, text_kwargs, ctx=ctx)
 
-def _get_text_metrics(text: str, ax: Axes, renderer, **text_kwargs) -> tuple:
+
+def _get_text_metrics_uncached(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> tuple:
     """
-    Get text metrics: (width, ascent) in data units.
+    Get text metrics: (width, ascent, height) in data units.
     - width: horizontal extent
     - ascent: distance from baseline to top of text
+    - height: line height for this style (see _get_text_height)
     """
-    kwargs = text_kwargs.copy()
-    kwargs.pop('underline', None)
+    if ctx is None:
+        ctx = _measure_ctx(ax, renderer)
+    kwargs = text_kwargs
     
     # Try shaping if available
     # Only use HarfBuzz measurement if the text actually needs complex shaping.
@@ -439,167 +789,433 @@ def _get_text_metrics(text: str, ax: Axes, renderer, **text_kwargs) -> tuple:
         path = _resolve_font_path(kwargs)
         try:
             if path:
-                fontsize = kwargs.get('fontsize') or kwargs.get('size') or plt.rcParams['font.size']
-                shaper = HarfbuzzShaper(path)
-                
-                # Get width and ascent in points
+                fontsize = kwargs.get('fontsize') or kwargs.get('size') or ctx.default_size
+                shaper = get_shaper(path)
+
+                # Width in points from the shaped buffer; the font-level
+                # vertical metrics come from the per-(path, size) cache.
                 width_points = shaper.get_text_width(text, fontsize)
-                ascent_points = shaper.get_ascent(fontsize)
-                
-                # Convert to pixels then to data units
-                from matplotlib.transforms import Bbox
-                
-                width_px = renderer.points_to_pixels(width_points)
-                ascent_px = renderer.points_to_pixels(ascent_points)
-                
-                # Width: horizontal conversion
-                bbox_w = Bbox.from_bounds(0, 0, width_px, 0)
-                width_data = bbox_w.transformed(ax.transData.inverted()).width
-                
-                # Ascent: vertical conversion
-                bbox_a = Bbox.from_bounds(0, 0, 0, ascent_px)
-                ascent_data = bbox_a.transformed(ax.transData.inverted()).height
-                
-                return (width_data, ascent_data)
+                ascent_points, height_points = _font_vmetrics(path, fontsize)
+
+                # Convert to pixels then to data units with the cached
+                # scale factors (one multiply per extent). Height is the
+                # full line height, fused into this pass so the draw phase
+                # never re-measures.
+                width_data = ctx.pts2px(width_points) * ctx.sx
+                ascent_data = ctx.pts2px(ascent_points) * ctx.sy
+                height_data = ctx.pts2px(height_points) * ctx.sy
+
+                return (width_data, ascent_data, height_data)
         except Exception:
             pass  # Fallback to native
-    
-    # Native measurement
-    t = ax.text(0, 0, text, **kwargs)
+
+    # Native measurement with the figure's persistent detached artist.
+    t = _measurement_artist(ax.get_figure(), kwargs)
+    t.set_text(text)
     bbox = t.get_window_extent(renderer=renderer)
-    bbox_data = bbox.transformed(ax.transData.inverted())
-    
-    width_data = bbox_data.width
+
+    width_data = bbox.width * ctx.sx
     # For native text, ascent ≈ height (simplified; baseline is at bottom of bbox)
-    ascent_data = bbox_data.height
-    
-    t.remove()
-    return (width_data, ascent_data)
+    ascent_data = bbox.height * ctx.sy
 
+    height_data = _get_text_height(text, ax, renderer, ctx=ctx, **text_kwargs)
+    return (width_data, ascent_data, height_data)
 
-def _get_text_height(text: str, ax: Axes, renderer, **text_kwargs) -> float:
+
+def _get_text_height(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> float:
+    """Measure the height of a text string (memoized)."""
+    return _measure_cached('height', _get_text_height_uncached,
+                           text, ax, renderer, text_kwargs, ctx=ctx)
+
+
+def _get_text_height_uncached(text: str, ax: Axes, renderer, ctx=None, **text_kwargs) -> float:
     """Measure the height of a text string."""
-    # Remove custom properties that ax.text doesn't understand
-    kwargs = text_kwargs.copy()
-    kwargs.pop('underline', None)
+    if ctx is None:
+        ctx = _measure_ctx(ax, renderer)
+    kwargs = text_kwargs
 
-    # Try shaping-based height for Devanagari fonts
-    # This avoids measuring with Latin chars that the font might not have
-    if HAS_HARFBUZZ:
-        path = _resolve_font_path(kwargs)
+    # Height is a property of the face, not the string: take it from the
+    # font's hhea table (via the shaper when available, else straight from
+    # FreeType) instead of laying out a probe string. This also avoids
+    # measuring with Latin chars that e.g. a Devanagari font might not have.
+    path = _resolve_font_path(kwargs)
+    if path:
+        fontsize = kwargs.get('fontsize') or kwargs.get('size') or ctx.default_size
         try:
-            # Check if this is a known Devanagari font (simplified check via path for now? 
-            # Or assume if resolving worked and contained Devanagari chars earlier...
-            # Actually valid logic: if we are here and path resolves, we trust it?
-            # But the original code restricted it to known fonts.
-            # Let's keep it generally open if path is found, OR check font name.
-            
-            if path:
-                # Optional: check for Devanagari-likeness if needed, but path resolution implies intent.
-                # However, for height specifically we only wanted this for specific fonts to avoid 'Hg'.
-                # Let's be permissive if path is found since we use shaper now.
-                
-                fontsize = kwargs.get('fontsize') or kwargs.get('size') or plt.rcParams['font.size']
-                shaper = HarfbuzzShaper(path)
-                height_points = shaper.get_font_height(fontsize)
-                
-                # Convert points -> pixels -> data
-                pixels = renderer.points_to_pixels(height_points)
-                from matplotlib.transforms import Bbox
-                bbox_display = Bbox.from_bounds(0, 0, 0, pixels)
-                bbox_data = bbox_display.transformed(ax.transData.inverted())
-                return bbox_data.height
+            if HAS_HARFBUZZ:
+                height_points = _font_vmetrics(path, fontsize)[1]
+            else:
+                height_points = _ft_font_height_points(path, fontsize)
+            # Convert points -> pixels -> data with the cached scale.
+            return ctx.pts2px(height_points) * ctx.sy
         except Exception:
             pass  # Fallback to native
 
-    # Use a representative character for height if text is empty or space
-    # But we need the height of THIS specific font configuration.
+    # Last resort when no font file resolves: probe with a representative
+    # string ("Hg" covers ascender and descender when text is blank).
     measure_text = text if text.strip() else "Hg"
-    t = ax.text(0, 0, measure_text, **kwargs)
+    t = _measurement_artist(ax.get_figure(), kwargs)
+    t.set_text(measure_text)
     bbox = t.get_window_extent(renderer=renderer)
-    bbox_data = bbox.transformed(ax.transData.inverted())
-    h = bbox_data.height
-    t.remove()
-    return h
+    return bbox.height * ctx.sy
+
+
+def _measure_words(
+    words: List[Tuple[str, Dict[str, Any]]],
+    ax: Axes,
+    renderer,
+    ctx=None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Measure every word in one pass.
+
+    Returns parallel (widths, ascents, heights, shaped) arrays so downstream
+    layout works on contiguous columns rather than per-word tuples. Words
+    sharing the same metrics-affecting properties are measured with a single
+    reused hidden artist instead of one throwaway artist each. The shaped
+    column records _needs_complex_shaping per word so the draw phase never
+    re-scans the strings.
+    """
+    metrics: List[Optional[Tuple[float, float, float]]] = [None] * len(words)
+    shaped = np.zeros(len(words), dtype=bool)
+
+    if ctx is None:
+        ctx = _measure_ctx(ax, renderer)
+
+    # Group plain-text words by metric signature for batched measurement.
+    groups: Dict[Tuple, List[int]] = {}
+    for i, (word, props, _) in enumerate(words):
+        if _needs_complex_shaping(word):
+            shaped[i] = True
+            metrics[i] = _get_text_metrics(word, ax, renderer, ctx=ctx, **props)
+        else:
+            groups.setdefault(_metric_signature(props), []).append(i)
+
+    for sig, indices in groups.items():
+        if len(indices) == 1:
+            i = indices[0]
+            word, props, _ = words[i]
+            metrics[i] = _get_text_metrics(word, ax, renderer, ctx=ctx, **props)
+            continue
+        kwargs = {k: v for k, v in words[indices[0]][1].items()
+                  if k not in _NON_METRIC_KEYS}
+        t = _measurement_artist(ax.get_figure(), kwargs, sig=sig)
+        # Line height is a font-level quantity: with the shaper available it
+        # comes from the (path, size) vertical-metrics cache and does not
+        # depend on the word, so one measurement covers the whole group.
+        group_height = None
+        if HAS_HARFBUZZ:
+            first_word, first_props, _ = words[indices[0]]
+            group_height = _get_text_height(first_word, ax, renderer,
+                                            ctx=ctx, **first_props)
+        # Within one style group, duplicate words ("the ", "of ") are common
+        # in prose; measure each distinct word once and fan the result out.
+        seen: Dict[str, Tuple[float, float, float]] = {}
+        for i in indices:
+            word, props, _ = words[i]
+            m = seen.get(word)
+            if m is None:
+                t.set_text(word)
+                # Read the extent in display units and convert with the
+                # cached scale factors: two multiplies instead of running
+                # the bbox through the inverse affine per word.
+                bbox = t.get_window_extent(renderer=renderer)
+                height = (group_height if group_height is not None else
+                          _get_text_height(word, ax, renderer, ctx=ctx,
+                                           **props))
+                m = (bbox.width * ctx.sx, bbox.height * ctx.sy, height)
+                seen[word] = m
+            metrics[i] = m
+
+    # Single precision is ample for sub-pixel text placement and halves the
+    # bandwidth of the layout columns.
+    widths = np.array([m[0] for m in metrics], dtype=np.float32)
+    ascents = np.array([m[1] for m in metrics], dtype=np.float32)
+    heights = np.array([m[2] for m in metrics], dtype=np.float32)
+    return widths, ascents, heights, shaped
 
 
 def _build_lines_wrapped(
-    words: List[Tuple[str, Dict[str, Any]]], 
-    ax: Axes, 
-    renderer, 
-    box_width: float
-) -> List[List[Tuple[str, Dict[str, Any], float, float]]]:
+    words: List[Tuple[str, Dict[str, Any]]],
+    ax: Axes,
+    renderer,
+    box_width: float,
+    ctx=None,
+    wrap_algo: str = 'optimal'
+) -> List[Dict[str, Any]]:
     """
     Group words into lines based on box_width.
-    Returns: List of lines, where each line is List of (word, props, width, ascent).
+    Returns: List of line dicts (see _make_line).
     """
-    lines: List[List[Tuple[str, Dict[str, Any], float, float]]] = []
-    current_line: List[Tuple[str, Dict[str, Any], float, float]] = []
-    current_line_width = 0.0
+    widths, ascents, heights, shaped = _measure_words(words, ax, renderer,
+                                                      ctx=ctx)
+
+    word_texts = [w for w, _, _ in words]
+    word_props = [p for _, p, _ in words]
+    word_underlines = [u for _, _, u in words]
+
+    breaker = _wrap_indices if wrap_algo == 'greedy' else _wrap_indices_optimal
+
+    lines: List[Dict[str, Any]] = []
+    start = 0
+    for end in breaker(widths, box_width):
+        lines.append(_make_line(word_texts[start:end], word_props[start:end],
+                                widths[start:end], ascents[start:end],
+                                heights[start:end], shaped[start:end],
+                                word_underlines[start:end]))
+        start = end
 
-    for word, props in words:
-        w, asc = _get_text_metrics(word, ax, renderer, **props)
-        
-        if current_line_width + w > box_width and current_line:
-            # Wrap to new line
-            lines.append(current_line)
-            current_line = [(word, props, w, asc)]
-            current_line_width = w
-        else:
-            current_line.append((word, props, w, asc))
-            current_line_width += w
-            
-    if current_line:
-        lines.append(current_line)
-        
     return lines
 
 
+def _make_line(words, props, widths, ascents, heights, shaped,
+               underlines) -> Dict[str, Any]:
+    """
+    Assemble one line in struct-of-arrays form: parallel lists for the
+    Python-object columns (words, props) and NumPy columns for the numeric
+    ones, so per-line reductions (max ascent, total width) run in C instead
+    of over per-word tuples.
+    """
+    return {'words': words, 'props': props, 'widths': widths,
+            'ascents': ascents, 'heights': heights, 'shaped': shaped,
+            'underlines': underlines}
+
+
+def _wrap_indices(widths: np.ndarray, box_width: float) -> List[int]:
+    """
+    First-fit line breaking on a width column: return the end index of each
+    line. A line ends before the first word whose running width exceeds
+    box_width; prefix sums plus a binary search find that break in C instead
+    of accumulating word-by-word in Python.
+
+    Kept as a standalone numeric kernel (arrays in, indices out) so the
+    layout math stays separable from the artist bookkeeping around it.
+    """
+    ends: List[int] = []
+    n = len(widths)
+    # One prefix sum for the whole column; each line break is then a single
+    # binary search against cum[start-1] + box_width, so the pass is
+    # O(n log n) instead of re-accumulating from every line start.
+    cum = np.cumsum(widths, dtype=np.float64)
+    start = 0
+    base = 0.0
+    while start < n:
+        end = int(np.searchsorted(cum, base + box_width, side='right'))
+        # An over-wide word still occupies a line of its own.
+        end = max(end, start + 1)
+        ends.append(end)
+        start = end
+        base = cum[end - 1]
+    return ends
+
+
+def _wrap_indices_optimal(widths: np.ndarray, box_width: float) -> List[int]:
+    """
+    Optimal line breaking on a width column: return the end index of each
+    line, chosen to minimize the summed squared leftover space over all
+    lines but the last (Knuth-Plass style least-raggedness, without
+    hyphenation or stretchable glue).
+
+    Dynamic program over break positions: ``cost[j]`` is the best total
+    penalty for the first ``j`` words. The feasible break window for each
+    ``j`` is found with one binary search on the prefix sums, and the
+    candidate costs over that window are evaluated as numpy slice
+    arithmetic (one subtract, one square, one argmin in C) rather than a
+    Python scan, so the pass is O(n * max_words_per_line) with the inner
+    loop vectorized. An over-wide word still occupies a line of its own,
+    matching the greedy breaker.
+    """
+    n = len(widths)
+    cum = np.empty(n + 1, dtype=np.float64)
+    cum[0] = 0.0
+    np.cumsum(widths, dtype=np.float64, out=cum[1:])
+
+    cost = np.empty(n + 1, dtype=np.float64)
+    cost[0] = 0.0
+    back = np.zeros(n + 1, dtype=np.intp)
+    for j in range(1, n + 1):
+        # Leftmost feasible break: first i with cum[j] - cum[i] <= box_width.
+        lo = int(np.searchsorted(cum, cum[j] - box_width, side='left'))
+        if lo >= j:
+            # Single over-wide word: feasible by fiat, no slack penalty.
+            cost[j] = cost[j - 1]
+            back[j] = j - 1
+            continue
+        window = cost[lo:j]
+        if j < n:
+            slack = box_width - (cum[j] - cum[lo:j])
+            window = window + slack * slack
+        # else: the last line is allowed to be short for free.
+        k = int(np.argmin(window))
+        cost[j] = window[k]
+        back[j] = lo + k
+
+    ends: List[int] = []
+    j = n
+    while j > 0:
+        ends.append(j)
+        j = int(back[j])
+    ends.reverse()
+    return ends
+
+
+# Properties that do not affect text metrics; segments differing only in
+# these can share one measurement artist.
+_NON_METRIC_KEYS = frozenset({'color', 'alpha', 'backgroundcolor', 'underline'})
+
+
+def _metric_signature(props: Dict[str, Any]) -> Tuple:
+    """Hashable signature of the properties that affect text metrics."""
+    if type(props) is FrozenProps:
+        try:
+            return _frozen_metric_signature(props)
+        except (TypeError, ValueError):
+            # Values like numpy arrays break the cache's equality probe;
+            # fall through to the direct computation.
+            pass
+    return tuple(sorted((k, repr(v)) for k, v in props.items()
+                        if k not in _NON_METRIC_KEYS))
+
+
+@lru_cache(maxsize=1024)
+def _frozen_metric_signature(props: FrozenProps) -> Tuple:
+    """Signature computation memoized on the props' own hash."""
+    return tuple(sorted((k, repr(v)) for k, v in props.items()
+                        if k not in _NON_METRIC_KEYS))
+
+
 def _build_line_seamless(
     strings: List[str],
     properties: List[Dict[str, Any]],
+    underlines: List[bool],
     ax: Axes,
-    renderer
-) -> List[Tuple[str, Dict[str, Any], float, float]]:
+    renderer,
+    ctx=None
+) -> Dict[str, Any]:
     """
     Build a single line from strings without splitting by spaces.
-    Returns: List of (string, props, width, ascent).
+    Returns: a line dict (see _make_line).
+
+    Measurement is delegated to _measure_words, which batches segments
+    sharing a metric signature into one reused artist — so mixed-style lines
+    still get one artist per style run rather than one per segment.
     """
-    line: List[Tuple[str, Dict[str, Any], float, float]] = []
-    for string, props in zip(strings, properties):
-        w, asc = _get_text_metrics(string, ax, renderer, **props)
-        line.append((string, props, w, asc))
-    return line
+    segments = list(zip(strings, properties, underlines))
+    widths, ascents, heights, shaped = _measure_words(segments, ax, renderer,
+                                                      ctx=ctx)
+    return _make_line(list(strings), list(properties),
+                      widths, ascents, heights, shaped, list(underlines))
 
 
-def _draw_lines(
-    lines: List[List[Tuple[str, Dict[str, Any], float, float]]],
+def _fast_line_ok(strings, underlines) -> bool:
+    """
+    Whether the no-wrap fast path applies: every segment is non-blank native
+    text with no underline. Blank segments are excluded because their line
+    height comes from an 'Hg' probe rather than their own bbox, and shaped or
+    underlined segments need the full pipeline.
+    """
+    return (all(s.strip() for s in strings)
+            and not any(underlines)
+            and not any(_needs_complex_shaping(s) for s in strings))
+
+
+def _draw_line_fast(
+    strings,
+    properties: List[Dict[str, Any]],
     x: float,
     y: float,
     ax: Axes,
     renderer,
+    ctx,
     linespacing: float,
     ha: str,
     va: str,
     transform,
     zorder: int
+) -> List[Text]:
+    """
+    Single-pass layout for the common no-wrap case.
+
+    The final artists are created first (at the origin) and measured in
+    place, then shifted to their cumulative positions — one artist and one
+    extent query per segment, with no separate measurement artists and no
+    line-structure bookkeeping. Placement math matches _draw_lines for a
+    one-line block of native text, where each segment's line height equals
+    its own bbox height.
+    """
+    texts: List[Text] = []
+    for s, props in zip(strings, properties):
+        kw = props.copy()
+        kw.update({'va': 'baseline', 'ha': 'left',
+                   'transform': transform, 'zorder': zorder})
+        texts.append(ax.text(0, 0, s, **kw))
+
+    n = len(texts)
+    widths = np.empty(n, dtype=np.float64)
+    ascents = np.empty(n, dtype=np.float64)
+    for i, t in enumerate(texts):
+        bbox = t.get_window_extent(renderer=renderer)
+        widths[i] = bbox.width
+        ascents[i] = bbox.height
+    # One vectorized display->data conversion for the whole line.
+    widths *= ctx.sx
+    ascents *= ctx.sy
+
+    max_ascent = float(ascents.max()) if n else 0.0
+    line_height = max_ascent * linespacing
+
+    if va == 'top':
+        top_y = y
+    elif va == 'bottom':
+        top_y = y + line_height
+    else:  # center (default)
+        top_y = y + line_height / 2
+    baseline_y = top_y - max_ascent
+
+    line_width = float(widths.sum())
+    if ha == 'center':
+        line_start_x = x - (line_width / 2)
+    elif ha == 'right':
+        line_start_x = x - line_width
+    else:  # left
+        line_start_x = x
+
+    xs = line_start_x + np.cumsum(widths) - widths
+    for t, xi in zip(texts, xs):
+        t.set_position((xi, baseline_y))
+
+    return texts
+
+
+def _draw_lines(
+    lines: List[Dict[str, Any]],
+    x: float,
+    y: float,
+    ax: Axes,
+    renderer,
+    linespacing: float,
+    ha: str,
+    va: str,
+    transform,
+    zorder: int,
+    ctx=None
 ) -> List[Text]:
     """
     Draw the lines of text onto the axes using baseline alignment.
-    Each line item is (word, props, width, ascent).
+    Each line is a struct-of-arrays dict (see _make_line).
     """
     text_objects: List[Text] = []
-    
-    # Calculate metrics for each line
+
+    if ctx is None:
+        ctx = _measure_ctx(ax, renderer)
+
+    # Calculate metrics for each line; heights were already measured during
+    # line building, so no second measurement pass is needed here. The
+    # reductions run on the numeric columns directly.
     line_metrics = []
     for line in lines:
-        # Find max ascent and max total height in this line
-        max_ascent = max(item[3] for item in line) if line else 0.0
-        max_height = 0.0
-        for word, props, w, asc in line:
-            h = _get_text_height(word, ax, renderer, **props)
-            if h > max_height:
-                max_height = h
+        max_ascent = float(line['ascents'].max()) if line['words'] else 0.0
+        max_height = float(line['heights'].max()) if line['words'] else 0.0
         line_metrics.append((max_ascent, max_height * linespacing))
         
     total_block_height = sum(m[1] for m in line_metrics)
@@ -615,7 +1231,25 @@ def _draw_lines(
         top_y = y + (total_block_height / 2)
 
     current_y = top_y
-    
+
+    # Props are interned, so one prepared kwargs dict per distinct style
+    # serves every word that carries it instead of a copy+update per word.
+    kwargs_cache: Dict[int, Dict[str, Any]] = {}
+
+    def _text_kwargs(props):
+        cached = kwargs_cache.get(id(props))
+        if cached is None:
+            cached = props.copy()
+            # Use baseline alignment for all text
+            cached.update({
+                'va': 'baseline',
+                'ha': 'left',
+                'transform': transform,
+                'zorder': zorder
+            })
+            kwargs_cache[id(props)] = cached
+        return cached
+
     for i, line in enumerate(lines):
         max_ascent, line_height = line_metrics[i]
         
@@ -623,37 +1257,51 @@ def _draw_lines(
         # Baseline is at: top of line - max_ascent
         baseline_y = current_y - max_ascent
         
-        # Calculate line width for horizontal alignment
-        line_width = sum(item[2] for item in line)
-        
+        widths = line['widths']
+
+        # Left alignment needs no line width; skip the sum in that common
+        # case.
         if ha == 'center':
-            line_start_x = x - (line_width / 2)
+            line_start_x = x - float(widths.sum()) / 2
         elif ha == 'right':
-            line_start_x = x - line_width
+            line_start_x = x - float(widths.sum())
         else:  # left
             line_start_x = x
-            
-        current_x = line_start_x
-        
-        for word, props, w, asc in line:
-            text_kwargs = props.copy()
-            
-            # Extract underline property
-            underline = text_kwargs.pop('underline', False)
-            
-            # Use baseline alignment for all text
-            text_kwargs.update({
-                'va': 'baseline', 
-                'ha': 'left',
-                'transform': transform,
-                'zorder': zorder
-            })
+
+        # Per-word x positions as one exclusive prefix sum instead of a
+        # running current_x accumulated in the loop below.
+        xs = line_start_x + np.cumsum(widths, dtype=np.float64) - widths
+
+        words_col = line['words']
+        props_col = line['props']
+        shaped_col = line['shaped']
+        underline_col = line['underlines']
+        n_words = len(words_col)
+
+        k = 0
+        while k < n_words:
+            props = props_col[k]
+            needs_shape = bool(shaped_col[k])
+            underline = underline_col[k]
+            # Collapse a run of consecutive plain (non-shaped,
+            # non-underlined) words sharing the same interned style into
+            # one artist: one Text layout per run instead of per word.
+            # Shaped and underlined words keep their own artist.
+            j = k + 1
+            if not needs_shape and not underline:
+                while (j < n_words and props_col[j] is props
+                       and not shaped_col[j] and not underline_col[j]):
+                    j += 1
+            word = words_col[k] if j == k + 1 else ''.join(words_col[k:j])
+            current_x = xs[k]
+            w = widths[k]
+            text_kwargs = _text_kwargs(props)
             
             # Determine if we should use ShapedText
             used_shaper = False
             t = None
             
-            if HAS_HARFBUZZ and _needs_complex_shaping(word):
+            if HAS_HARFBUZZ and needs_shape:
                 try:
                     path = _resolve_font_path(text_kwargs)
                     if path:
@@ -702,7 +1350,7 @@ def _draw_lines(
                 # For consistency with previous code, let's try getting bbox.
                 try:
                     bbox = t.get_window_extent(renderer=renderer)
-                    bbox_data = bbox.transformed(ax.transData.inverted())
+                    bbox_data = bbox.transformed(ctx.inv)
                     y_bottom = bbox_data.y0
                 except Exception:
                     # Fallback if renderer issue
@@ -723,9 +1371,9 @@ def _draw_lines(
                     zorder=zorder
                 )
                 ax.add_line(line)
-            
-            current_x += w
-            
+
+            k = j
+
         current_y -= line_height
         
     return text_objects
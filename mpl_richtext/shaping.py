@@ -1,51 +1,92 @@
 
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.font_manager as fm
 from matplotlib.path import Path
-from matplotlib.transforms import Affine2D
+from matplotlib.transforms import Affine2D, IdentityTransform
 from typing import List, Tuple, Optional, Any
+from functools import lru_cache
 import warnings
 
-try:
-    import uharfbuzz as hb
-    from fontTools.ttLib import TTFont
-    from fontTools.pens.basePen import BasePen
-    HAS_HARFBUZZ = True
-except ImportError:
-    HAS_HARFBUZZ = False
 
-class MatplotlibPathPen(BasePen):
-    def __init__(self, glyphSet):
-        super().__init__(glyphSet)
-        self.verts = []
-        self.codes = []
+@lru_cache(maxsize=64)
+def _rotation_matrix(theta_deg):
+    """3x3 affine rotation matrix for theta_deg, cached across draws."""
+    matrix = Affine2D().rotate_deg(theta_deg).get_matrix()
+    matrix.flags.writeable = False
+    return matrix
+
+# Availability is probed without importing: fontTools alone costs hundreds
+# of milliseconds to load, which every `import mpl_richtext` would pay even
+# when no text ever needs shaping. The actual imports happen in _lazy_hb()
+# the first time a shaper is built.
+from importlib.util import find_spec as _find_spec
+
+HAS_HARFBUZZ = (_find_spec('uharfbuzz') is not None
+                and _find_spec('fontTools') is not None)
+
+_hb_modules = None
+
+
+def _lazy_hb():
+    """Import and cache (hb, TTFont, MatplotlibPathPen) on first use."""
+    global _hb_modules
+    if _hb_modules is None:
+        import uharfbuzz as hb
+        from fontTools.ttLib import TTFont
+        from fontTools.pens.basePen import BasePen
 
-    def _moveTo(self, p):
-        self.verts.append(p)
-        self.codes.append(Path.MOVETO)
+        class MatplotlibPathPen(BasePen):
+            def __init__(self, glyphSet):
+                super().__init__(glyphSet)
+                self.verts = []
+                self.codes = []
 
-    def _lineTo(self, p):
-        self.verts.append(p)
-        self.codes.append(Path.LINETO)
+            def _moveTo(self, p):
+                self.verts.append(p)
+                self.codes.append(Path.MOVETO)
 
-    def _curveToOne(self, p1, p2, p3):
-        self.verts.extend([p1, p2, p3])
-        self.codes.extend([Path.CURVE4, Path.CURVE4, Path.CURVE4])
+            def _lineTo(self, p):
+                self.verts.append(p)
+                self.codes.append(Path.LINETO)
 
-    def _qCurveToOne(self, p1, p2):
-        self.verts.extend([p1, p2])
-        self.codes.extend([Path.CURVE3, Path.CURVE3])
+            def _curveToOne(self, p1, p2, p3):
+                self.verts.extend([p1, p2, p3])
+                self.codes.extend([Path.CURVE4, Path.CURVE4, Path.CURVE4])
+
+            def _qCurveToOne(self, p1, p2):
+                self.verts.extend([p1, p2])
+                self.codes.extend([Path.CURVE3, Path.CURVE3])
+
+            def _closePath(self):
+                self.verts.append((0, 0))
+                self.codes.append(Path.CLOSEPOLY)
+
+        _hb_modules = (hb, TTFont, MatplotlibPathPen)
+    return _hb_modules
+
+@lru_cache(maxsize=32)
+def get_shaper(font_path: str) -> "HarfbuzzShaper":
+    """
+    Return a shared HarfbuzzShaper for a font file.
+
+    Creating a shaper parses the font with both HarfBuzz and fontTools, so
+    per-word instantiation re-reads the same .ttf over and over; this factory
+    loads each font once per process.
+    """
+    return HarfbuzzShaper(font_path)
 
-    def _closePath(self):
-        self.verts.append((0, 0))
-        self.codes.append(Path.CLOSEPOLY)
 
 class HarfbuzzShaper:
     def __init__(self, font_path: str):
         if not HAS_HARFBUZZ:
             raise ImportError("uharfbuzz and fonttools are required for manual shaping.")
-            
+
+        hb, TTFont, pen_cls = _lazy_hb()
+        self._hb = hb
+        self._pen_cls = pen_cls
+
         self.font_path = font_path
         
         # Load for HarfBuzz
@@ -61,12 +102,40 @@ class HarfbuzzShaper:
         self.glyph_set = self.ttfont.getGlyphSet()
         self.glyph_order = self.ttfont.getGlyphOrder()
 
+        # Atlas of extracted glyph outlines keyed by glyph id; drawing the
+        # same glyph again (or redrawing for bbox measurement) reuses the
+        # Path instead of re-running the pen over the outline. Vertical
+        # outline extents are kept alongside for alignment math.
+        self._glyph_path_cache = {}
+        self._glyph_vext_cache = {}
+
+        # Shaped glyph buffers keyed by text. Measurement asks for width,
+        # ascent and height of the same word, and drawing shapes it again;
+        # each shape call re-runs the full OpenType pipeline, so one run per
+        # distinct string is enough.
+        self._shape_cache = {}
+        self._shape_cache_max = 512
+
+        # Assembled (path, x, y) glyph lists keyed by text. Every draw of
+        # an unchanged ShapedText re-requests the same string, so the
+        # positioned-glyph assembly is done once per distinct text, not per
+        # frame.
+        self._paths_cache = {}
+
     def shape(self, text: str) -> Tuple[List[Any], List[Any]]:
-        buf = hb.Buffer()
-        buf.add_str(text)
-        buf.guess_segment_properties()
-        hb.shape(self.font, buf)
-        return buf.glyph_infos, buf.glyph_positions
+        cached = self._shape_cache.get(text)
+        if cached is None:
+            buf = self._hb.Buffer()
+            buf.add_str(text)
+            buf.guess_segment_properties()
+            self._hb.shape(self.font, buf)
+            # The info/position objects keep the buffer alive, so the
+            # results stay valid after buf goes out of scope.
+            cached = (buf.glyph_infos, buf.glyph_positions)
+            if len(self._shape_cache) >= self._shape_cache_max:
+                self._shape_cache.clear()
+            self._shape_cache[text] = cached
+        return cached
 
     def get_text_width(self, text: str, fontsize: float) -> float:
         infos, positions = self.shape(text)
@@ -92,43 +161,83 @@ class HarfbuzzShaper:
         else:
             return fontsize * 0.8  # Rough approximation
 
-    def get_shaped_paths(self, text: str) -> List[Tuple[Path, float, float, float]]:
+    def _glyph_path(self, gid: int) -> Optional[Path]:
+        """Outline for one glyph id from the atlas, extracting on miss."""
+        if gid in self._glyph_path_cache:
+            return self._glyph_path_cache[gid]
+        try:
+            glyph_name = self.glyph_order[gid]
+        except IndexError:
+            path = None
+        else:
+            pen = self._pen_cls(self.glyph_set)
+            self.glyph_set[glyph_name].draw(pen)
+            if pen.verts:
+                # Materialize the pen output as typed arrays and freeze
+                # the Path: readonly paths let matplotlib skip defensive
+                # copies when the same glyph is drawn frame after frame.
+                path = Path(np.asarray(pen.verts, dtype=np.float64),
+                            np.asarray(pen.codes, dtype=Path.code_type),
+                            readonly=True)
+                ext = path.get_extents()
+                self._glyph_vext_cache[gid] = (ext.ymin, ext.ymax)
+            else:
+                path = None
+        self._glyph_path_cache[gid] = path
+        return path
+
+    def get_shaped_paths(
+        self, text: str
+    ) -> Tuple[List[Path], np.ndarray, np.ndarray]:
         """
-        Returns list of (Path, x_pos, y_pos, scale_factor)
-        Path is in Font Units.
-        Pos is in Font Units.
+        Shaped glyph outlines for *text* in struct-of-arrays form.
+
+        Returns ``(paths, origins, vexts)``: the cached Path per glyph, an
+        (N, 2) array of glyph origins relative to the start of the string,
+        and an (N, 2) array of per-glyph (ymin, ymax) outline extents, all
+        in font units. Parallel columns rather than per-glyph tuples, so
+        draw-time alignment and transform math runs as whole-array
+        operations.
         """
+        cached = self._paths_cache.get(text)
+        if cached is not None:
+            return cached
+
         infos, positions = self.shape(text)
-        
-        results = []
-        current_x = 0
-        current_y = 0
-        
-        for info, pos in zip(infos, positions):
-            gid = info.codepoint
-            try:
-                glyph_name = self.glyph_order[gid]
-            except IndexError:
-                continue
-                
-            pen = MatplotlibPathPen(self.glyph_set)
-            self.glyph_set[glyph_name].draw(pen)
-            
-            if pen.verts:
-                path = Path(pen.verts, pen.codes)
-                
-                # We return position relative to start of string
-                # x = cursor + off_x
-                # y = cursor + off_y
-                x = current_x + pos.x_offset
-                y = current_y + pos.y_offset
-                
-                results.append((path, x, y))
-                
-            current_x += pos.x_advance
-            current_y += pos.y_advance
-            
-        return results
+        n = len(positions) if positions else 0
+        if n == 0:
+            return ([], np.empty((0, 2)), np.empty((0, 2)))
+
+        # Glyph origins = exclusive prefix sum of the advances plus the
+        # per-glyph offsets, computed as whole-array cumsum/add instead of
+        # a running total carried through the Python loop.
+        advances = np.fromiter(
+            (v for pos in positions for v in (pos.x_advance, pos.y_advance)),
+            dtype=np.float64, count=2 * n).reshape(-1, 2)
+        all_origins = np.fromiter(
+            (v for pos in positions for v in (pos.x_offset, pos.y_offset)),
+            dtype=np.float64, count=2 * n).reshape(-1, 2)
+        if n:
+            all_origins[1:] += np.cumsum(advances[:-1], axis=0)
+
+        # The remaining loop only resolves outlines from the atlas; glyphs
+        # without one (e.g. whitespace) are dropped from all columns.
+        paths: List[Path] = []
+        keep: List[int] = []
+        for i, info in enumerate(infos):
+            if self._glyph_path(info.codepoint) is not None:
+                paths.append(self._glyph_path_cache[info.codepoint])
+                keep.append(i)
+
+        result = (paths,
+                  all_origins[keep].reshape(-1, 2),
+                  np.asarray([self._glyph_vext_cache[infos[i].codepoint]
+                              for i in keep],
+                             dtype=np.float64).reshape(-1, 2))
+        if len(self._paths_cache) >= self._shape_cache_max:
+            self._paths_cache.clear()
+        self._paths_cache[text] = result
+        return result
 
 from matplotlib.text import Text
 from matplotlib.transforms import Affine2D
@@ -139,7 +248,11 @@ class ShapedText(Text):
     """
     def __init__(self, x, y, text, font_path, **kwargs):
         super().__init__(x, y, text, **kwargs)
-        self.shaper = HarfbuzzShaper(font_path)
+        # Share the per-font shaper: constructing one parses the font with
+        # both HarfBuzz and fontTools, and the factory also makes the
+        # measurement pass and the draw path hit the same shape/glyph
+        # caches.
+        self.shaper = get_shaper(font_path)
         
     def draw(self, renderer):
         if renderer is not None:
@@ -154,8 +267,9 @@ class ShapedText(Text):
         # gc.set_url(self.get_url())
         
         # 2. Get shaping results
-        # Path is in Font Units (e.g. 1000 or 2048 UPEM)
-        paths_and_pos = self.shaper.get_shaped_paths(self.get_text())
+        # Paths/origins/extents are in Font Units (e.g. 1000 or 2048 UPEM)
+        glyph_paths, origins, vexts = self.shaper.get_shaped_paths(
+            self.get_text())
         
         # 3. Calculate Transform
         # Text transform: (Data X, Data Y) -> (Screen X, Screen Y)
@@ -203,38 +317,19 @@ class ShapedText(Text):
         va = self.get_verticalalignment()
         
         if va != 'baseline':
-            # Calculate bounds
-            min_y = float('inf')
-            max_y = float('-inf')
-            has_paths = False
-            
-            for path, gx, gy in paths_and_pos:
-                if not path.vertices.size:
-                    continue
-                # Get extents of this path (in font units, relative to its origin 0,0)
-                ext = path.get_extents()
-                # Shift by glyph position
-                # path.vertices are relative to glyph origin.
-                # (gx, gy) is glyph origin relative to string origin.
-                # So absolute y = vert_y + gy
-                # extents are (xmin, ymin, xmax, ymax)
-                
-                # Careful: Bbox object behavior
-                glyph_ymin = ext.ymin + gy
-                glyph_ymax = ext.ymax + gy
-                
-                if glyph_ymin < min_y: min_y = glyph_ymin
-                if glyph_ymax > max_y: max_y = glyph_ymax
-                has_paths = True
-            
-            if not has_paths:
+            # Vertical bounds of the whole string: each glyph's cached
+            # outline extents shifted by its origin, reduced as two array
+            # operations instead of a Python loop over Bboxes.
+            if len(glyph_paths):
+                glyph_y = origins[:, 1]
+                min_y = float((vexts[:, 0] + glyph_y).min())
+                max_y = float((vexts[:, 1] + glyph_y).max())
+            else:
                 # Fallback to font metrics if no glyphs (e.g. space) or bbox failure
                 # height ~ ascender - descender?
                 # Center ~ (ascender + descender) / 2
-                asc = self.shaper.face.ascender
-                desc = self.shaper.face.descender
-                min_y = desc
-                max_y = asc
+                min_y = self.shaper.face.descender
+                max_y = self.shaper.face.ascender
             
             # Now determine offset (in Font Units)
             # We want to shift so that the reference point (e.g. center) is at 0.
@@ -270,21 +365,42 @@ class ShapedText(Text):
         align_transform = Affine2D().translate(offset_x, offset_y)
         
         # Rotation & Translation to Screen Position
-        placement_transform = Affine2D().rotate_deg(rotation).translate(screen_x, screen_y)
+        # Skip the trig entirely for the common unrotated case.
+        if rotation:
+            placement_transform = Affine2D(_rotation_matrix(rotation).copy())
+            placement_transform.translate(screen_x, screen_y)
+        else:
+            placement_transform = Affine2D().translate(screen_x, screen_y)
         
-        # Loop and draw
-        for path, gx, gy in paths_and_pos:
-            # Transform for this specific glyph
-            # Move glyph to its place in the string (scaled)
-            # Actually since we scale the whole coordinate system, gx/gy are in FontUnits.
-            # So: Translate(gx, gy) -> Scale(scale) ...
-            
-            glyph_trans = Affine2D().translate(gx, gy) + base_transform + align_transform + placement_transform
-            
-            from matplotlib.colors import to_rgba
-            rgba_color = to_rgba(self.get_color(), alpha=self.get_alpha())
-            renderer.draw_path(gc, path, glyph_trans, rgbFace=rgba_color)
-            
+        # Blend color and alpha once for the whole string, not per glyph.
+        from matplotlib.colors import to_rgba
+        rgba_color = to_rgba(self.get_color(), alpha=self.get_alpha())
+
+        # Fuse scale, alignment and placement into one matrix up front.
+        # Each glyph then only contributes its (gx, gy) translation in font
+        # units, folded into the translation column directly, instead of
+        # composing four Affine2D objects per glyph inside the loop.
+        fixed = (base_transform + align_transform
+                 + placement_transform).get_matrix()
+
+        # Stack the per-glyph matrices and hand the whole string to the
+        # backend in one draw_path_collection call, so the glyph loop runs
+        # inside the renderer instead of one draw_path dispatch per glyph.
+        if glyph_paths:
+            all_transforms = np.tile(fixed, (len(glyph_paths), 1, 1))
+            # Fold each glyph origin into the translation column in one
+            # whole-array multiply-add.
+            all_transforms[:, :2, 2] += origins @ fixed[:2, :2].T
+            # The per-glyph draw_path calls both filled and stroked each
+            # outline with the gc's default linewidth; passing the same
+            # color as edgecolor keeps the rendered output pixel-identical.
+            renderer.draw_path_collection(
+                gc, IdentityTransform(), glyph_paths, all_transforms,
+                np.zeros((1, 2)), IdentityTransform(),
+                np.array([rgba_color]), np.array([rgba_color]),
+                np.array([gc.get_linewidth()]), [(0, None)], [True], [None],
+                'screen')
+
         gc.restore()
 
 
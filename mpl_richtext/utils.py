@@ -0,0 +1,258 @@
+"""
+Utility helpers for Nepali-locale text: digit conversion and number formatting.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.ticker import Formatter
+
+# Lakh/crore grouping: a separator goes after any digit followed by an odd
+# run (2k+3) of digits to the string's end. Compiled once; one C-level sub
+# per call instead of Python-level slicing and joining.
+_INT_GROUP_RE = re.compile(r'(\d)(?=(?:\d\d)*\d{3}$)')
+
+# Multiline variant for bulk formatting: one sub over many
+# newline-joined numbers at once.
+_INT_GROUP_BULK_RE = re.compile(r'(\d)(?=(?:\d\d)*\d{3}$)', re.MULTILINE)
+
+# English -> Devanagari digit mapping
+NEPALI_DIGITS = {
+    '0': '०', '1': '१', '2': '२', '3': '३', '4': '४',
+    '5': '५', '6': '६', '7': '७', '8': '८', '9': '९',
+}
+
+# Single-pass Devanagari digit translation table for str.translate.
+_DIGIT_TRANS = str.maketrans(NEPALI_DIGITS)
+
+# English -> Nepali day names
+NEPALI_DAYS = {
+    'Sunday': 'आइतबार',
+    'Monday': 'सोमबार',
+    'Tuesday': 'मङ्गलबार',
+    'Wednesday': 'बुधबार',
+    'Thursday': 'बिहिबार',
+    'Friday': 'शुक्रबार',
+    'Saturday': 'शनिबार',
+}
+
+# English -> Nepali month names
+NEPALI_MONTHS = {
+    'January': 'जनवरी',
+    'February': 'फेब्रुअरी',
+    'March': 'मार्च',
+    'April': 'अप्रिल',
+    'May': 'मे',
+    'June': 'जुन',
+    'July': 'जुलाई',
+    'August': 'अगस्ट',
+    'September': 'सेप्टेम्बर',
+    'October': 'अक्टोबर',
+    'November': 'नोभेम्बर',
+    'December': 'डिसेम्बर',
+}
+
+
+# All day/month substitutions fused into one alternation: a single pass
+# over the string replaces every known word via the merged lookup table,
+# instead of one full scan (and one intermediate string) per name. Keys
+# are sorted longest-first so longer names win where one prefixes
+# another, and word boundaries keep e.g. 'Mayfair' intact.
+_WORD_MAP = {en.lower(): ne
+             for en, ne in {**NEPALI_DAYS, **NEPALI_MONTHS}.items()}
+# IGNORECASE forces the matcher through per-character case folding, so
+# the realistic casings (lowercase, Capitalized, UPPERCASE) are spelled
+# out in the alternation instead and matching stays a plain literal scan.
+_WORD_ALT = '|'.join(sorted(
+    {re.escape(v) for k in _WORD_MAP
+     for v in (k, k.capitalize(), k.upper())},
+    key=len, reverse=True))
+_WORD_RE = re.compile(r'\b(' + _WORD_ALT + r')\b')
+
+# Combined words-or-digit pattern: mixed strings ('Friday 10') are
+# converted in a single linear scan instead of a word pass followed by
+# a digit pass over the whole string.
+_WORD_OR_DIGIT_RE = re.compile(r'\b(' + _WORD_ALT + r')\b|[0-9]')
+
+
+# The word map is ASCII-only, so a letter probe decides whether the
+# alternation can match at all; re.search runs in C versus a Python-level
+# any() loop over characters.
+_ALPHA_RE = re.compile(r'[A-Za-z]')
+
+
+def _word_or_digit(m):
+    word = m.group(1)
+    if word is not None:
+        return _WORD_MAP[word.lower()]
+    return NEPALI_DIGITS[m.group(0)]
+
+
+def format_nepali_number(value):
+    """
+    Format a number using Nepali digits and Nepali (lakh/crore) digit grouping.
+
+    Nepali grouping places a separator after the rightmost three digits and
+    then after every two digits: 1234567 -> १२,३४,५६७.
+
+    Parameters
+    ----------
+    value : int, float, or str
+        The number to format. Existing thousands separators are ignored;
+        floats with no fractional part are formatted as integers.
+
+    Returns
+    -------
+    str
+        The formatted number in Devanagari digits.
+    """
+    # Collapse integral floats (2.0 -> 2) so the scalar path agrees with
+    # the bulk formatter's int64 cast — tick labels and the interactive
+    # coordinate readout must show the same text for the same value.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return _format_nepali_number_cached(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _format_nepali_number_cached(text):
+    # Axis labels and legends repeat the same few values; memoizing on the
+    # normalized string form makes repeats a dict hit. Separators only
+    # appear in pre-formatted string input, so probe before copying.
+    if ',' in text:
+        text = text.replace(',', '')
+    negative = text.startswith('-')
+    if negative:
+        text = text[1:]
+    if '.' in text:
+        int_part, frac_part = text.split('.', 1)
+    else:
+        int_part, frac_part = text, ''
+
+    # Group the integer part: rightmost three digits, then groups of two,
+    # in a single pass of the precompiled pattern. Up to three digits no
+    # separator can be placed, so skip the regex machinery entirely.
+    if len(int_part) > 3:
+        grouped = _INT_GROUP_RE.sub(r'\1,', int_part)
+    else:
+        grouped = int_part
+
+    # Reassemble sign, integer and fraction in one join instead of
+    # building a fresh intermediate string per piece.
+    parts = []
+    if negative:
+        parts.append('-')
+    parts.append(grouped)
+    if frac_part:
+        parts.append('.')
+        parts.append(frac_part)
+    # Single-pass digit conversion via the shared translation table.
+    return ''.join(parts).translate(_DIGIT_TRANS)
+
+
+def format_nepali_number_array(values):
+    """
+    Format a whole array of integers with Nepali digits and grouping.
+
+    The array is rendered to digit strings, joined, grouped with a single
+    multiline regex pass, and digit-translated in one str.translate call,
+    so the per-element Python overhead of calling
+    :func:`format_nepali_number` in a loop (e.g. over 10^4 tick values)
+    disappears. Inputs that are not all integral (floats with fractions,
+    pre-formatted strings) fall back to the scalar path per element.
+
+    Parameters
+    ----------
+    values : array-like
+        The numbers to format.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of formatted strings, same length as the input.
+    """
+    arr = np.asarray(values)
+    if arr.size == 0:
+        # ''.split('\n') would yield [''] and break the reshape below.
+        return np.empty(arr.shape, dtype=object)
+    if arr.dtype.kind == 'f' and np.all(np.isfinite(arr)) \
+            and np.all(arr == np.floor(arr)):
+        arr = arr.astype(np.int64)
+    if arr.dtype.kind not in 'iu':
+        return np.array([format_nepali_number(v) for v in arr.ravel()]
+                        ).reshape(arr.shape)
+
+    joined = '\n'.join(np.char.mod('%d', arr.ravel()).tolist())
+    joined = _INT_GROUP_BULK_RE.sub(r'\1,', joined)
+    joined = joined.translate(_DIGIT_TRANS)
+    return np.array(joined.split('\n')).reshape(arr.shape)
+
+
+def format_nepali_numbers(values):
+    """
+    Format an iterable of numbers, returning a plain list of strings.
+
+    Convenience wrapper over :func:`format_nepali_number_array` for callers
+    that want Python lists (e.g. ``ax.set_xticklabels``) rather than a
+    numpy array, while keeping the single-pass bulk formatting path.
+
+    Parameters
+    ----------
+    values : iterable
+        The numbers to format.
+
+    Returns
+    -------
+    list of str
+        The formatted numbers, in input order.
+    """
+    return format_nepali_number_array(list(values)).tolist()
+
+
+def convert_to_nepali(text):
+    """
+    Convert English digits and day/month names in a string to Nepali.
+
+    Day and month names are matched in their lowercase, Capitalized, and
+    UPPERCASE spellings; all other characters pass through unchanged.
+
+    Parameters
+    ----------
+    text : str
+        The text to convert.
+
+    Returns
+    -------
+    str
+        The text with digits and known words replaced by Nepali equivalents.
+    """
+    return _convert_to_nepali_cached(str(text))
+
+
+@lru_cache(maxsize=1024)
+def _convert_to_nepali_cached(text):
+    # Purely numeric strings (tick labels, years) can skip the word
+    # alternation entirely; only the digit translation applies.
+    if _ALPHA_RE.search(text) is None:
+        return text.translate(_DIGIT_TRANS)
+    return _WORD_OR_DIGIT_RE.sub(_word_or_digit, text)
+
+
+class NepaliFormatter(Formatter):
+    """
+    Axis tick formatter producing Nepali digits with lakh/crore grouping.
+
+    Matplotlib formats a whole tick set through :meth:`format_ticks`, which
+    here routes into the single-pass bulk path instead of one scalar
+    formatting call per tick::
+
+        ax.xaxis.set_major_formatter(mpl_richtext.NepaliFormatter())
+    """
+
+    def __call__(self, x, pos=None):
+        return format_nepali_number(x)
+
+    def format_ticks(self, values):
+        self.set_locs(values)
+        return format_nepali_numbers(values)
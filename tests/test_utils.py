@@ -0,0 +1,122 @@
+"""
+Tests for the Nepali text utility helpers.
+"""
+import sys
+
+from mpl_richtext import format_nepali_number, convert_to_nepali
+
+
+class TestFormatNepaliNumber:
+    """Test Nepali digit formatting and grouping."""
+
+    def test_small_number(self):
+        assert format_nepali_number(123) == '१२३'
+
+    def test_lakh_grouping(self):
+        assert format_nepali_number(1234567) == '१२,३४,५६७'
+
+    def test_thousand_grouping(self):
+        assert format_nepali_number(1234) == '१,२३४'
+
+    def test_decimal(self):
+        assert format_nepali_number(1234.56) == '१,२३४.५६'
+
+    def test_negative(self):
+        assert format_nepali_number(-1234567) == '-१२,३४,५६७'
+
+    def test_string_with_commas(self):
+        assert format_nepali_number('1,234,567') == '१२,३४,५६७'
+
+    def test_zero(self):
+        assert format_nepali_number(0) == '०'
+
+    def test_integral_float(self):
+        assert format_nepali_number(1000.0) == '१,०००'
+
+
+class TestFormatNepaliNumberArray:
+    """Test bulk array formatting."""
+
+    def test_matches_scalar(self):
+        from mpl_richtext import format_nepali_number_array
+        values = [0, 5, -12, 1234, 1234567]
+        expected = [format_nepali_number(v) for v in values]
+        assert format_nepali_number_array(values).tolist() == expected
+
+    def test_integral_floats(self):
+        from mpl_richtext import format_nepali_number_array
+        assert format_nepali_number_array([1000.0]).tolist() == ['१,०००']
+
+    def test_fractional_fallback(self):
+        from mpl_richtext import format_nepali_number_array
+        assert format_nepali_number_array([1234.56]).tolist() == ['१,२३४.५६']
+
+    def test_empty(self):
+        from mpl_richtext import format_nepali_number_array
+        assert format_nepali_number_array([]).tolist() == []
+    def test_list_wrapper(self):
+        from mpl_richtext import format_nepali_numbers
+        assert format_nepali_numbers(range(3)) == ['०', '१', '२']
+
+
+class TestConvertToNepali:
+    """Test English-to-Nepali text conversion."""
+
+    def test_digits(self):
+        assert convert_to_nepali('2082') == '२०८२'
+
+    def test_day_name(self):
+        assert convert_to_nepali('Sunday') == 'आइतबार'
+
+    def test_day_name_case_insensitive(self):
+        assert convert_to_nepali('sunday') == 'आइतबार'
+
+    def test_month_name(self):
+        assert convert_to_nepali('January 1') == 'जनवरी १'
+
+    def test_mixed_text(self):
+        assert convert_to_nepali('Meeting on Friday at 10') == 'Meeting on शुक्रबार at १०'
+
+    def test_passthrough(self):
+        assert convert_to_nepali('hello world') == 'hello world'
+
+
+class TestNepaliFormatter:
+    """Test the axis tick formatter."""
+
+    def test_format_ticks(self):
+        from mpl_richtext import NepaliFormatter
+        fmt = NepaliFormatter()
+        assert fmt.format_ticks([0, 1234567]) == ['०', '१२,३४,५६७']
+
+    def test_scalar_call(self):
+        from mpl_richtext import NepaliFormatter
+        assert NepaliFormatter()(1234) == '१,२३४'
+
+    def test_no_ticks(self):
+        from mpl_richtext import NepaliFormatter
+        assert NepaliFormatter().format_ticks([]) == []
+
+    def test_float_ticks_match_scalar(self):
+        from mpl_richtext import NepaliFormatter
+        fmt = NepaliFormatter()
+        assert fmt.format_ticks([2.0]) == [fmt(2.0)]
+
+
+def test_lazy_import():
+    """The utils module should only load on first attribute access."""
+    import pathlib
+    import subprocess
+
+    code = (
+        "import sys, mpl_richtext;"
+        "before = 'mpl_richtext.utils' in sys.modules;"
+        "mpl_richtext.format_nepali_number(1);"
+        "after = 'mpl_richtext.utils' in sys.modules;"
+        "print(before, after)"
+    )
+    root = pathlib.Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, cwd=root
+    )
+    assert result.stdout.split() == ['False', 'True']